@@ -110,19 +110,17 @@ the painter widget and it adds the graphic components to the painter's canvas.
 But it can be skipped if the painter is used only as
 a controller and there's no GUI active in which to display the shapes.
 """
-from functools import partial
-from math import cos, sin, atan2, pi
+from math import cos, sin, atan2, pi, degrees
 from typing import List, Optional
 
 from kivy.clock import Clock
-from kivy.metrics import dp
+from kivy.metrics import dp, Metrics
 from kivy.properties import OptionProperty, BooleanProperty, NumericProperty, \
     ListProperty
 from kivy.graphics import Ellipse, Line, Color, Point, Mesh, PushMatrix, \
     PopMatrix, Rotate, InstructionGroup
 from kivy.graphics.tesselator import Tesselator
 from kivy.event import EventDispatcher
-import copy
 
 __all__ = ('PaintCanvasBehavior', 'PaintShape', 'PaintCircle', 'PaintEllipse',
            'PaintPolygon', 'PaintFreeformPolygon', 'PaintPoint',
@@ -131,14 +129,92 @@ __all__ = ('PaintCanvasBehavior', 'PaintShape', 'PaintCircle', 'PaintEllipse',
 from kivy_garden.painter._version import __version__
 
 
-def _rotate_pos(x, y, cx, cy, angle, base_angle=0.):
-    """Rotates ``(x, y)`` by angle ``angle`` along a circle centered at
-    ``(cx, cy)``.
+def _nearest_vertex(points, x, y):
+    """Finds the vertex in the flat ``[x1, y1, x2, y2, ...]`` list of
+    ``points`` that is closest to ``(x, y)``.
+
+    :return: A 2-tuple of the vertex index and its squared distance to
+        ``(x, y)``. ``points`` must not be empty.
+    """
+    dists = [(px - x) * (px - x) + (py - y) * (py - y)
+             for px, py in zip(points[::2], points[1::2])]
+    min_d = min(dists)
+    return dists.index(min_d), min_d
+
+
+def _is_convex(points):
+    """Returns whether the closed polygon described by the flat
+    ``[x1, y1, x2, y2, ...]`` list of ``points`` is convex, in which case it
+    can be filled directly with a triangle fan over its vertices.
+
+    Collinear and repeated points are allowed, but self-intersecting
+    polygons (e.g. a star that always turns the same way, or an edge that
+    doubles back on the previous one) are not convex.
+    """
+    if len(points) < 6:
+        return False
+
+    # the edges of the closed polygon, skipping repeated points
+    edges = []
+    prev_x, prev_y = points[-2], points[-1]
+    for x, y in zip(points[::2], points[1::2]):
+        dx = x - prev_x
+        dy = y - prev_y
+        if dx or dy:
+            edges.append((dx, dy))
+            prev_x, prev_y = x, y
+    if len(edges) < 3:
+        return False
+
+    sign = 0
+    x_flips = 0
+    dx0, dy0 = edges[-1]
+    last_dx = next((dx for dx, _ in reversed(edges) if dx), 0)
+    for dx, dy in edges:
+        cross = dx0 * dy - dy0 * dx
+        if cross:
+            if sign and (cross > 0) != (sign > 0):
+                return False
+            sign = cross
+        elif dx0 * dx + dy0 * dy < 0:
+            return False
+
+        # a convex polygon only reverses its x direction twice
+        if dx:
+            if (dx > 0) != (last_dx > 0):
+                x_flips += 1
+                if x_flips > 2:
+                    return False
+            last_dx = dx
+
+        dx0, dy0 = dx, dy
+    return bool(sign)
+
+
+class _PaintTouchState(object):
+    """(internal) The state of a touch handled by
+    :class:`PaintCanvasBehaviorBase`, stored in ``touch.ud['paint_state']``.
     """
-    hyp = ((x - cx) ** 2 + (y - cy) ** 2) ** 0.5
-    xp = hyp * cos(angle + base_angle)
-    yp = hyp * sin(angle + base_angle)
-    return xp + cx, yp + cy
+
+    __slots__ = (
+        'interacted', 'interaction', 'touch_moved', 'selected_shape',
+        'was_selected', 'cleared_selection')
+
+    def __init__(self):
+        # whether the touch was used by the painter for any purpose whatsoever
+        self.interacted = False
+        # can be one of current, selected, done indicating how the touch was
+        # used, if it was used. done means the touch is done and don't do
+        # anything with anymore. selected means a shape was selected.
+        self.interaction = ''
+        # if this touch experienced a move
+        self.touch_moved = False
+        # the shape that was selected if interaction is selected
+        self.selected_shape = None
+        # whether the selected_shapes contained the shape this touch was
+        # used to select a shape in touch_down.
+        self.was_selected = False
+        self.cleared_selection = False
 
 
 class PaintCanvasBehaviorBase(EventDispatcher):
@@ -223,14 +299,33 @@ class PaintCanvasBehaviorBase(EventDispatcher):
 
     _long_touch_trigger = None
 
+    _long_touch_touch = None
+
     _ctrl_down = None
 
     _processing_touch = None
 
+    _shapes_set = None
+
+    _selected_shapes_set = None
+
+    _suppress_set_sync = False
+
+    _ARROWS = {
+        'left': (-1, 0), 'right': (1, 0), 'up': (0, 1), 'down': (0, -1)}
+
+    _CTRL_KEYS = frozenset(('lctrl', 'ctrl', 'rctrl'))
+
     def __init__(self, **kwargs):
         super(PaintCanvasBehaviorBase, self).__init__(**kwargs)
         self._ctrl_down = set()
+        self._long_touch_trigger = Clock.create_trigger(
+            self._do_pending_long_touch, self.long_touch_delay)
+        self._shapes_set = set(self.shapes)
+        self._selected_shapes_set = set(self.selected_shapes)
         self.fbind('locked', self._handle_locked)
+        self.fbind('shapes', self._sync_shapes_set)
+        self.fbind('selected_shapes', self._sync_selected_shapes_set)
 
         def set_focus(*largs):
             if not self.focus:
@@ -238,12 +333,29 @@ class PaintCanvasBehaviorBase(EventDispatcher):
         if hasattr(self, 'focus'):
             self.fbind('focus', set_focus)
 
+    def _sync_shapes_set(self, *largs):
+        # the painter methods keep the set updated one shape at a time, only
+        # rebuild it when the list is changed directly
+        if not self._suppress_set_sync:
+            self._shapes_set = set(self.shapes)
+
+    def _sync_selected_shapes_set(self, *largs):
+        if not self._suppress_set_sync:
+            self._selected_shapes_set = set(self.selected_shapes)
+
+    def _end_set_sync(self):
+        # observers of the lists may have changed them directly while the
+        # sync was suppressed, in which case the sets need to be rebuilt
+        self._suppress_set_sync = False
+        if len(self._shapes_set) != len(self.shapes):
+            self._shapes_set = set(self.shapes)
+        if len(self._selected_shapes_set) != len(self.selected_shapes):
+            self._selected_shapes_set = set(self.selected_shapes)
+
     def _handle_locked(self, *largs):
         if not self.locked:
             return
-        if self._long_touch_trigger:
-            self._long_touch_trigger.cancel()
-            self._long_touch_trigger = None
+        self._cancel_long_touch()
 
         self.finish_current_shape()
         self.clear_selected_shapes()
@@ -293,7 +405,10 @@ class PaintCanvasBehaviorBase(EventDispatcher):
             shape.stop_interaction()
 
     def clear_selected_shapes(self):
-        """De-selects all currently selected shapes."""
+        """De-selects all currently selected shapes.
+
+        :return: A new list of the shapes that were selected, if any.
+        """
         shapes = self.selected_shapes[:]
         for shape in shapes:
             self.deselect_shape(shape)
@@ -305,8 +420,7 @@ class PaintCanvasBehaviorBase(EventDispatcher):
 
         :return: List of the shapes that were deleted, if any.
         """
-        shapes = self.selected_shapes[:]
-        self.clear_selected_shapes()
+        shapes = self.clear_selected_shapes()
         if self.current_shape is not None:
             shapes.append(self.current_shape)
 
@@ -336,7 +450,12 @@ class PaintCanvasBehaviorBase(EventDispatcher):
         """
         if shape.select():
             self.finish_current_shape()
-            self.selected_shapes.append(shape)
+            self._selected_shapes_set.add(shape)
+            self._suppress_set_sync = True
+            try:
+                self.selected_shapes.append(shape)
+            finally:
+                self._end_set_sync()
             return True
         return False
 
@@ -348,7 +467,12 @@ class PaintCanvasBehaviorBase(EventDispatcher):
             de-selected.
         """
         if shape.deselect():
-            self.selected_shapes.remove(shape)
+            self._selected_shapes_set.discard(shape)
+            self._suppress_set_sync = True
+            try:
+                self.selected_shapes.remove(shape)
+            finally:
+                self._end_set_sync()
             return True
         return False
 
@@ -358,7 +482,12 @@ class PaintCanvasBehaviorBase(EventDispatcher):
         :param shape: :class:`PaintShape` instance to add.
         :return: A bool indicating whether the shape was successfully added.
         """
-        self.shapes.append(shape)
+        self._shapes_set.add(shape)
+        self._suppress_set_sync = True
+        try:
+            self.shapes.append(shape)
+        finally:
+            self._end_set_sync()
         return True
 
     def remove_shape(self, shape):
@@ -373,8 +502,13 @@ class PaintCanvasBehaviorBase(EventDispatcher):
             self.finish_current_shape()
         shape.remove_shape_from_canvas()
 
-        if shape in self.shapes:
-            self.shapes.remove(shape)
+        if shape in self._shapes_set:
+            self._shapes_set.remove(shape)
+            self._suppress_set_sync = True
+            try:
+                self.shapes.remove(shape)
+            finally:
+                self._end_set_sync()
             return True
         return False
 
@@ -390,16 +524,50 @@ class PaintCanvasBehaviorBase(EventDispatcher):
             end, otherwise it is moved after the given :class:`PaintShape` in
             :attr:`shapes`.
         """
-        self.shapes.remove(shape)
+        shapes = self.shapes
         if before_shape is None:
-            self.shapes.append(shape)
+            if shapes[-1] is shape:
+                return
+
+            shapes.remove(shape)
+            shapes.append(shape)
             shape.move_to_top()
-        else:
-            i = self.shapes.index(before_shape)
-            self.shapes.insert(i, shape)
+            return
+
+        old_i = shapes.index(shape)
+        i = shapes.index(before_shape)
+        if i and shapes[i - 1] is shape:
+            return
+
+        del shapes[old_i]
+        if old_i < i:
+            i -= 1
+        shapes.insert(i, shape)
+
+        # when moving down, the shape is already below the shapes it now needs
+        # to be below, so only the shapes above it need to be raised
+        if i < old_i:
+            i += 1
+        for s in shapes[i:]:
+            s.move_to_top()
 
-            for s in self.shapes[i:]:
-                s.move_to_top()
+    def _get_min_touch_dist_sq(self):
+        # the dp value is read each time, in case the screen density changed
+        return (self.min_touch_dist * Metrics.dp) ** 2
+
+    def _batch_translate_selected(self, dx, dy):
+        """Translates all the selected shapes by ``dx``, ``dy``. Used when
+        dragging the selection or when nudging it with the keyboard.
+
+        :param dx: The change in x.
+        :param dy: The change in y.
+        """
+        if not dx and not dy:
+            return
+
+        dpos = dx, dy
+        for shape in self.selected_shapes:
+            shape.translate(dpos=dpos)
 
     def duplicate_selected_shapes(self):
         """Duplicates all currently :attr:`selected_shapes` and adds them
@@ -410,8 +578,7 @@ class PaintCanvasBehaviorBase(EventDispatcher):
 
         :return: The original :attr:`selected_shapes` that were duplicated.
         """
-        shapes = self.selected_shapes[:]
-        self.clear_selected_shapes()
+        shapes = self.clear_selected_shapes()
         for shape in shapes:
             self.duplicate_shape(shape)
         return shapes
@@ -425,7 +592,7 @@ class PaintCanvasBehaviorBase(EventDispatcher):
         :param shape: :class:`PaintShape` to duplicate.
         :return: The new :class:`PaintShape` that was created.
         """
-        new_shape = copy.deepcopy(shape)
+        new_shape = shape.clone()
         self.add_shape(new_shape)
         new_shape.translate(dpos=(15, 15))
         return new_shape
@@ -499,13 +666,14 @@ class PaintCanvasBehaviorBase(EventDispatcher):
         :param y: The y pos.
         :return: The :class:`PaintShape` that is the closest as described.
         """
-        min_dist = dp(self.min_touch_dist)
+        pos = x, y
+        min_dist = self._get_min_touch_dist_sq()
         closest_shape = None
         for shape in reversed(self.shapes):  # upper shape takes pref
             if shape.locked:
                 continue
 
-            dist = shape.get_selection_point_dist((x, y))
+            dist = shape.get_selection_point_dist_sq(pos)
             if dist < min_dist:
                 closest_shape = shape
                 min_dist = dist
@@ -525,13 +693,15 @@ class PaintCanvasBehaviorBase(EventDispatcher):
         :param y: The y pos.
         :return: The :class:`PaintShape` that is the closest as described.
         """
-        min_dist = dp(self.min_touch_dist)
+        pos = x, y
+        min_dist = self._get_min_touch_dist_sq()
         closest_shape = None
         for shape in reversed(self.shapes):  # upper shape takes pref
             if shape.locked:
                 continue
 
-            dist = shape.get_interaction_point_dist((x, y))
+            dist = shape.get_interaction_point_dist_sq(
+                pos, max_dist_sq=min_dist)
             if dist < min_dist:
                 closest_shape = shape
                 min_dist = dist
@@ -539,21 +709,7 @@ class PaintCanvasBehaviorBase(EventDispatcher):
         return closest_shape
 
     def on_touch_down(self, touch):
-        ud = touch.ud
-        # whether the touch was used by the painter for any purpose whatsoever
-        ud['paint_interacted'] = False
-        # can be one of current, selected, done indicating how the touch was
-        # used, if it was used. done means the touch is done and don't do
-        # anything with anymore. selected means a shape was selected.
-        ud['paint_interaction'] = ''
-        # if this touch experienced a move
-        ud['paint_touch_moved'] = False
-        # the shape that was selected if paint_interaction is selected
-        ud['paint_selected_shape'] = None
-        # whether the selected_shapes contained the shape this touch was
-        # used to select a shape in touch_down.
-        ud['paint_was_selected'] = False
-        ud['paint_cleared_selection'] = False
+        state = touch.ud['paint_state'] = _PaintTouchState()
 
         if self.locked or self._processing_touch is not None:
             return super(PaintCanvasBehaviorBase, self).on_touch_down(touch)
@@ -564,42 +720,59 @@ class PaintCanvasBehaviorBase(EventDispatcher):
         if not self.collide_point(touch.x, touch.y):
             return False
 
-        ud['paint_interacted'] = True
+        state.interacted = True
         self._processing_touch = touch
         touch.grab(self)
 
         # if we have a current shape, all touch will go to it
         current_shape = self.current_shape
         if current_shape is not None:
-            ud['paint_cleared_selection'] = current_shape.finished and \
-                current_shape.get_interaction_point_dist(touch.pos) \
-                >= dp(self.min_touch_dist)
-            if ud['paint_cleared_selection']:
+            min_dist = self._get_min_touch_dist_sq()
+            state.cleared_selection = current_shape.finished and \
+                current_shape.get_interaction_point_dist_sq(
+                    touch.pos, max_dist_sq=min_dist) >= min_dist
+            if state.cleared_selection:
                 self.finish_current_shape()
 
             else:
-                ud['paint_interaction'] = 'current'
+                state.interaction = 'current'
                 current_shape.handle_touch_down(touch)
                 return True
 
         # next try to interact by selecting or interacting with selected shapes
         shape = self.get_closest_selection_point_shape(touch.x, touch.y)
         if shape is not None:
-            ud['paint_interaction'] = 'selected'
-            ud['paint_selected_shape'] = shape
-            ud['paint_was_selected'] = shape not in self.selected_shapes
-            self._long_touch_trigger = Clock.schedule_once(
-                partial(self.do_long_touch, touch), self.long_touch_delay)
+            state.interaction = 'selected'
+            state.selected_shape = shape
+            state.was_selected = shape not in self._selected_shapes_set
+            self._schedule_long_touch(touch)
             return True
 
         if self._ctrl_down:
-            ud['paint_interaction'] = 'done'
+            state.interaction = 'done'
             return True
 
-        self._long_touch_trigger = Clock.schedule_once(
-            partial(self.do_long_touch, touch), self.long_touch_delay)
+        self._schedule_long_touch(touch)
         return True
 
+    def _schedule_long_touch(self, touch):
+        trigger = self._long_touch_trigger
+        trigger.cancel()
+        trigger.timeout = self.long_touch_delay
+        self._long_touch_touch = touch
+        trigger()
+
+    def _cancel_long_touch(self):
+        if self._long_touch_touch is not None:
+            self._long_touch_trigger.cancel()
+            self._long_touch_touch = None
+
+    def _do_pending_long_touch(self, *largs):
+        touch = self._long_touch_touch
+        if touch is not None:
+            self._long_touch_touch = None
+            self.do_long_touch(touch)
+
     def do_long_touch(self, touch, *largs):
         """Handles a long touch by the user.
         """
@@ -607,133 +780,126 @@ class PaintCanvasBehaviorBase(EventDispatcher):
         touch.push()
         touch.apply_transform_2d(self.to_widget)
 
-        self._long_touch_trigger = None
-        ud = touch.ud
-        if ud['paint_interaction'] == 'selected':
+        state = touch.ud['paint_state']
+        if state.interaction == 'selected':
             if self._ctrl_down:
-                ud['paint_interaction'] = 'done'
+                state.interaction = 'done'
                 touch.pop()
                 return
-            ud['paint_interaction'] = ''
+            state.interaction = ''
 
-        assert ud['paint_interacted']
-        assert not ud['paint_interaction']
+        assert state.interacted
+        assert not state.interaction
 
         self.clear_selected_shapes()
         shape = self.get_closest_shape(touch.x, touch.y)
         if shape is not None:
-            ud['paint_interaction'] = 'current'
+            state.interaction = 'current'
             self.start_shape_interaction(shape, (touch.x, touch.y))
         else:
-            ud['paint_interaction'] = 'done'
+            state.interaction = 'done'
         touch.pop()
 
+    def _start_new_shape(self, touch):
+        # creates a new shape with the touch and makes it the current shape.
+        # Returns whether the shape is still being drawn
+        shape = self.create_shape_with_touch(touch)
+        if shape is None:
+            return False
+
+        shape.handle_touch_down(touch, opos=touch.opos)
+        self.current_shape = shape
+        if self.check_new_shape_done(shape, 'down'):
+            self.finish_current_shape()
+            return False
+        return True
+
     def on_touch_move(self, touch):
         # if touch.grab_current is not None:  ????????
         #     return False
 
-        ud = touch.ud
-        if 'paint_interacted' not in ud or not ud['paint_interacted']:
+        state = touch.ud.get('paint_state')
+        if state is None or not state.interacted:
             return super(PaintCanvasBehaviorBase, self).on_touch_move(touch)
 
-        if self._long_touch_trigger is not None:
-            self._long_touch_trigger.cancel()
-            self._long_touch_trigger = None
+        self._cancel_long_touch()
 
         if touch.grab_current is self:
             # for move, only use normal touch, not touch outside range
             return False
 
-        if ud['paint_interaction'] == 'done':
+        interaction = state.interaction
+        if interaction == 'done':
             return True
 
-        ud['paint_touch_moved'] = True
+        state.touch_moved = True
         if not self.collide_point(touch.x, touch.y):
             return True
 
-        if not ud['paint_interaction']:
-            if ud['paint_cleared_selection'] or self.clear_selected_shapes():
-                ud['paint_interaction'] = 'done'
+        if not interaction:
+            if state.cleared_selection or self.clear_selected_shapes():
+                state.interaction = 'done'
                 return True
 
             # finally try creating a new shape
             # touch must have originally collided otherwise we wouldn't be here
-            shape = self.create_shape_with_touch(touch)
-            if shape is not None:
-                shape.handle_touch_down(touch, opos=touch.opos)
-                self.current_shape = shape
-                if self.check_new_shape_done(shape, 'down'):
-                    self.finish_current_shape()
-                    ud['paint_interaction'] = 'done'
-                    return True
-
-                ud['paint_interaction'] = 'current_new'
-            else:
-                ud['paint_interaction'] = 'done'
+            if not self._start_new_shape(touch):
+                state.interaction = 'done'
                 return True
+            interaction = state.interaction = 'current_new'
 
-        if ud['paint_interaction'] in ('current', 'current_new'):
-            if self.current_shape is None:
-                ud['paint_interaction'] = 'done'
+        if interaction == 'current' or interaction == 'current_new':
+            current_shape = self.current_shape
+            if current_shape is None:
+                state.interaction = 'done'
             else:
-                self.current_shape.handle_touch_move(touch)
+                current_shape.handle_touch_move(touch)
             return True
 
-        assert ud['paint_interaction'] == 'selected'
+        assert interaction == 'selected'
 
-        shape = ud['paint_selected_shape']
-        if shape not in self.shapes:
-            ud['paint_interaction'] = 'done'
+        shape = state.selected_shape
+        if shape not in self._shapes_set:
+            state.interaction = 'done'
             return True
 
         if self._ctrl_down or self.multiselect:
-            if shape not in self.selected_shapes:
+            if shape not in self._selected_shapes_set:
                 self.select_shape(shape)
         else:
-            if len(self.selected_shapes) != 1 or \
-                    self.selected_shapes[0] != shape:
+            selected_shapes = self.selected_shapes
+            if len(selected_shapes) != 1 or selected_shapes[0] != shape:
                 self.clear_selected_shapes()
                 self.select_shape(shape)
 
-        for s in self.selected_shapes:
-            s.translate(dpos=(touch.dx, touch.dy))
+        self._batch_translate_selected(touch.dx, touch.dy)
         return True
 
     def on_touch_up(self, touch):
-        ud = touch.ud
-        if 'paint_interacted' not in ud or not ud['paint_interacted']:
+        state = touch.ud.get('paint_state')
+        if state is None or not state.interacted:
             return super(PaintCanvasBehaviorBase, self).on_touch_up(touch)
 
-        if self._long_touch_trigger is not None:
-            self._long_touch_trigger.cancel()
-            self._long_touch_trigger = None
+        self._cancel_long_touch()
 
         touch.ungrab(self)
         # don't process the same touch up again
-        paint_interaction = ud['paint_interaction']
-        ud['paint_interaction'] = 'done'
+        paint_interaction = state.interaction
+        state.interaction = 'done'
 
         self._processing_touch = None
         if paint_interaction == 'done':
             return True
 
         if not paint_interaction:
-            if ud['paint_cleared_selection'] or self.clear_selected_shapes():
+            if state.cleared_selection or self.clear_selected_shapes():
                 return True
 
             # finally try creating a new shape
             # touch must have originally collided otherwise we wouldn't be here
-            shape = self.create_shape_with_touch(touch)
-            if shape is not None:
-                shape.handle_touch_down(touch, opos=touch.opos)
-                self.current_shape = shape
-                if self.check_new_shape_done(shape, 'down'):
-                    self.finish_current_shape()
-                    return True
-
-                paint_interaction = 'current_new'
-            else:
+            if not self._start_new_shape(touch):
                 return True
+            paint_interaction = 'current_new'
 
         if paint_interaction in ('current', 'current_new'):
             if self.current_shape is not None:
@@ -747,26 +913,27 @@ class PaintCanvasBehaviorBase(EventDispatcher):
             return True
 
         assert paint_interaction == 'selected'
-        if ud['paint_touch_moved']:
+        if state.touch_moved:
             # moving normally doesn't change the selection state
 
             # this is a quick selection mode where someone dragged a object but
             # nothing was selected so don't keep the object that was dragged
             # selected
-            if ud['paint_was_selected'] and \
+            if state.was_selected and \
                     len(self.selected_shapes) == 1 and \
-                    self.selected_shapes[0] == ud['paint_selected_shape']:
+                    self.selected_shapes[0] == state.selected_shape:
                 self.clear_selected_shapes()
             return True
 
-        shape = ud['paint_selected_shape']
-        if shape not in self.shapes:
+        shape = state.selected_shape
+        if shape not in self._shapes_set:
             return True
 
         if self._ctrl_down or self.multiselect:
-            if not ud['paint_was_selected'] and shape in self.selected_shapes:
+            if not state.was_selected and \
+                    shape in self._selected_shapes_set:
                 self.deselect_shape(shape)
-            elif ud['paint_was_selected']:
+            elif state.was_selected:
                 self.select_shape(shape)
         else:
             if len(self.selected_shapes) != 1 or \
@@ -777,21 +944,18 @@ class PaintCanvasBehaviorBase(EventDispatcher):
         return True
 
     def keyboard_on_key_down(self, window, keycode, text, modifiers):
-        if keycode[1] in ('lctrl', 'ctrl', 'rctrl'):
+        if keycode[1] in self._CTRL_KEYS:
             self._ctrl_down.add(keycode[1])
 
-        arrows = {
-            'left': (-1, 0), 'right': (1, 0), 'up': (0, 1), 'down': (0, -1)}
+        arrows = self._ARROWS
         if keycode[1] in arrows and self.selected_shapes:
-            dpos = arrows[keycode[1]]
-            for shape in self.selected_shapes:
-                shape.translate(dpos=dpos)
+            self._batch_translate_selected(*arrows[keycode[1]])
             return True
 
         return False
 
     def keyboard_on_key_up(self, window, keycode):
-        if keycode[1] in ('lctrl', 'ctrl', 'rctrl'):
+        if keycode[1] in self._CTRL_KEYS:
             self._ctrl_down.remove(keycode[1])
 
         if keycode[1] == 'escape':
@@ -844,9 +1008,8 @@ class PaintShape(EventDispatcher):
 
     .. code-block:: python
 
-        import copy
         shape = PaintCircle(...)
-        new_shape = copy.deepcopy(shape)
+        new_shape = shape.clone()
         painter.add_shape(new_shape)
         new_shape.translate(dpos=(15, 15))
 
@@ -928,13 +1091,6 @@ class PaintShape(EventDispatcher):
     Read only.
     """
 
-    graphics_name = ''
-    """The group name given to all the canvas instructions added to the
-    :attr:`instruction_group`. These are the lines, points etc.
-
-    Read only and is automatically set when the shape is created.
-    """
-
     instruction_group = None
     """A :class:`~kivy.graphics.InstructionGroup` instance to which all the
     canvas instructions that the shape displays is added to.
@@ -951,14 +1107,24 @@ class PaintShape(EventDispatcher):
     Read only.
     """
 
+    _graphics_name = None
+
+    _defer_update = False
+
+    _update_graphics_trigger = None
+
+    _STATE_FIELDS = (
+        'line_color', 'line_width', 'is_valid', 'locked', 'line_color_locked')
+    """The names of the attributes saved by :meth:`get_state`. Subclasses
+    extend it with their own fields.
+    """
+
     __events__ = ('on_update', )
 
     def __init__(
             self, line_color=(0, 1, 0, 1),
             line_color_locked=(.4, .56, .36, 1),
             selection_point_color=(1, .5, .31, 1), **kwargs):
-        self.graphics_name = '{}-{}'.format(self.__class__.__name__, id(self))
-
         super(PaintShape, self).__init__(**kwargs)
         self.line_color = line_color
         self.line_color_locked = line_color_locked
@@ -968,6 +1134,24 @@ class PaintShape(EventDispatcher):
         self.fbind('line_width', self._update_from_line_width)
         self.fbind('pointsize', self._update_from_pointsize)
 
+    @property
+    def graphics_name(self):
+        """The group name given to all the canvas instructions added to the
+        :attr:`instruction_group`. These are the lines, points etc.
+
+        Read only and is automatically set the first time it is used.
+        """
+        name = self._graphics_name
+        if name is None:
+            name = self._graphics_name = '{}-{}'.format(
+                self.__class__.__name__, id(self))
+        return name
+
+    def _update_graphics(self, *largs):
+        # the graphics are updated at most once per frame, from the
+        # current state, through _update_graphics_trigger
+        pass
+
     def _update_from_line_width(self, *args):
         pass
 
@@ -977,6 +1161,12 @@ class PaintShape(EventDispatcher):
     def on_update(self, *largs):
         pass
 
+    def _dispatch_update(self):
+        # dispatches on_update, unless it's deferred while changing many
+        # properties at once, e.g. in set_state
+        if not self._defer_update:
+            self.dispatch('on_update')
+
     def set_valid(self):
         """Called internally after the shape potentially
         :attr:`is_valid`, to set :attr:`is_valid` in case the shape is now
@@ -1016,6 +1206,12 @@ class PaintShape(EventDispatcher):
         self.paint_widget = paint_widget
         with paint_widget.canvas:
             self.instruction_group = InstructionGroup()
+
+        # nothing is drawn before the shape is added, so only create the
+        # trigger now
+        if self._update_graphics_trigger is None:
+            self._update_graphics_trigger = Clock.create_trigger(
+                self._update_graphics, 0)
         return True
 
     def remove_shape_from_canvas(self):
@@ -1127,6 +1323,35 @@ class PaintShape(EventDispatcher):
         """
         raise NotImplementedError
 
+    def get_selection_point_dist_sq(self, pos):
+        """Like :meth:`get_selection_point_dist`, but returns the squared
+        distance. This is what :class:`PaintCanvasBehaviorBase` uses to compare
+        shapes, so it doesn't have to compute a square root for each shape.
+
+        By default it squares :meth:`get_selection_point_dist`. Shapes should
+        override it to compute it directly, and when overriding one of them,
+        both should be overridden.
+
+        :param pos: The position to which to compute the min point distance.
+        :return: The minimum squared distance to pos, or a very large number
+            if there's no selection point available.
+        """
+        return self.get_selection_point_dist(pos) ** 2
+
+    def get_interaction_point_dist_sq(self, pos, max_dist_sq=None):
+        """Like :meth:`get_interaction_point_dist`, but returns the squared
+        distance. See :meth:`get_selection_point_dist_sq`.
+
+        :param pos: The position to which to compute the min point distance.
+        :param max_dist_sq: If not None, the caller only cares whether the
+            distance is less than this. If the shape can cheaply tell that all
+            its points are at least this far, it may return any value not
+            smaller than ``max_dist_sq`` without computing the exact distance.
+        :return: The minimum squared distance to pos, or a very large number
+            if there's no interaction points available.
+        """
+        return self.get_interaction_point_dist(pos) ** 2
+
     def finish(self):
         """Called by
         :meth:`PaintCanvasBehaviorBase.finish_current_shape` when it wants
@@ -1276,8 +1501,7 @@ class PaintShape(EventDispatcher):
         :return: A dict with all the config data of the shape.
         """
         d = {} if state is None else state
-        for k in ['line_color', 'line_width', 'is_valid', 'locked',
-                  'line_color_locked']:
+        for k in self._STATE_FIELDS:
             d[k] = getattr(self, k)
         d['cls'] = self.__class__.__name__
 
@@ -1290,24 +1514,33 @@ class PaintShape(EventDispatcher):
         :param state: A dict with shape specific configuration values.
         """
         state = dict(state)
+        state.pop('cls', None)
         lock = None
-        for k, v in state.items():
-            if k == 'locked':
-                lock = bool(v)
-                continue
-            elif k == 'cls':
-                continue
-            setattr(self, k, v)
-
-        self.finish()
-
-        if lock is True:
-            self.lock()
-        elif lock is False:
-            self.unlock()
+        if 'locked' in state:
+            lock = bool(state.pop('locked'))
+
+        # dispatch on_update once, after all the properties are set
+        self._defer_update = True
+        try:
+            for k, v in state.items():
+                setattr(self, k, v)
+
+            self.finish()
+
+            if lock is True:
+                self.lock()
+            elif lock is False:
+                self.unlock()
+        finally:
+            self._defer_update = False
         self.dispatch('on_update')
 
-    def __deepcopy__(self, memo):
+    def clone(self):
+        """Creates and returns a new finished shape of the same class and with
+        the same configuration as this shape, see :meth:`get_state`.
+
+        The new shape is not added to any painter or canvas.
+        """
         obj = self.__class__()
         obj.set_state(self.get_state())
 
@@ -1315,6 +1548,9 @@ class PaintShape(EventDispatcher):
         obj.finish()
         return obj
 
+    def __deepcopy__(self, memo):
+        return self.clone()
+
     def add_area_graphics_to_canvas(self, name, canvas):
         """Add graphics instructions to ``canvas`` such that the inside area
         of the shapes will be colored in with the color instruction
@@ -1334,14 +1570,16 @@ class PaintShape(EventDispatcher):
         :meth:`hide_shape_in_canvas` to display the shape again.
         """
         for color in self.color_instructions:
-            color.rgba = [color.r, color.g, color.b, 1.]
+            if color.a != 1.:
+                color.a = 1.
 
     def hide_shape_in_canvas(self):
         """Hides the shape so that it is not visible in the widget to which it
         was added with :meth:`add_shape_to_canvas`.
         """
         for color in self.color_instructions:
-            color.rgba = [color.r, color.g, color.b, 0.]
+            if color.a:
+                color.a = 0.
 
     def rescale(self, scale):
         """Rescales the all the perimeter points/lines distance from the center
@@ -1393,11 +1631,18 @@ class PaintCircle(PaintShape):
     """(internal) The graphics instruction representing the selection point.
     """
 
+    _last_circle = None
+
+    _sel_pts = None
+
+    _STATE_FIELDS = PaintShape._STATE_FIELDS + ('center', 'radius')
+
     ready_to_finish = True
 
     is_valid = True
 
     def __init__(self, **kwargs):
+        self._sel_pts = [0, 0]
         super(PaintCircle, self).__init__(**kwargs)
 
         def update(*largs):
@@ -1439,27 +1684,30 @@ class PaintCircle(PaintShape):
         if not super(PaintCircle, self).add_shape_to_canvas(paint_widget):
             return False
 
+        add = self.instruction_group.add
+        name = self.graphics_name
         colors = self.color_instructions = []
 
         x, y = self.center
         r = self.radius
-        inst = self.ellipse_color_inst = Color(
-            *self.line_color, group=self.graphics_name)
+        inst = self.ellipse_color_inst = Color(*self.line_color, group=name)
         colors.append(inst)
 
-        self.instruction_group.add(inst)
+        add(inst)
+        circle = self._last_circle = x, y, r
         inst = self.perim_ellipse_inst = Line(
-            circle=(x, y, r), width=self.line_width,
-            group=self.graphics_name)
-        self.instruction_group.add(inst)
-        inst = Color(*self.selection_point_color, group=self.graphics_name)
-        self.instruction_group.add(inst)
+            circle=circle, width=self.line_width, group=name)
+        add(inst)
+        inst = Color(*self.selection_point_color, group=name)
+        add(inst)
         colors.append(inst)
 
+        sel_pts = self._sel_pts
+        sel_pts[0] = x + r
+        sel_pts[1] = y
         inst = self.selection_point_inst = Point(
-            points=[x + r, y], pointsize=self.pointsize,
-            group=self.graphics_name)
-        self.instruction_group.add(inst)
+            points=sel_pts, pointsize=self.pointsize, group=name)
+        add(inst)
         return True
 
     def remove_shape_from_canvas(self):
@@ -1467,6 +1715,7 @@ class PaintCircle(PaintShape):
             self.ellipse_color_inst = None
             self.perim_ellipse_inst = None
             self.selection_point_inst = None
+            self._last_circle = None
             return True
         return False
 
@@ -1512,13 +1761,19 @@ class PaintCircle(PaintShape):
         return False
 
     def get_selection_point_dist(self, pos):
+        return self.get_selection_point_dist_sq(pos) ** 0.5
+
+    def get_interaction_point_dist(self, pos):
+        return self.get_selection_point_dist_sq(pos) ** 0.5
+
+    def get_selection_point_dist_sq(self, pos):
         x1, y1 = pos
         x2, y2 = self.center
         x2 += self.radius
-        return ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+        return (x1 - x2) ** 2 + (y1 - y2) ** 2
 
-    def get_interaction_point_dist(self, pos):
-        return self.get_selection_point_dist(pos)
+    def get_interaction_point_dist_sq(self, pos, max_dist_sq=None):
+        return self.get_selection_point_dist_sq(pos)
 
     def lock(self):
         if super(PaintCircle, self).lock():
@@ -1559,21 +1814,35 @@ class PaintCircle(PaintShape):
         else:
             x, y = self.center
 
-        r = self.radius
-        self.center = x, y
+        center = self.center
+        if center[0] != x or center[1] != y:
+            # the center binding calls translate() again, which updates the
+            # graphics and dispatches on_update
+            self.center = x, y
+            return True
+
         if self.perim_ellipse_inst is not None:
-            self.perim_ellipse_inst.circle = x, y, r
-        if self.selection_point_inst is not None:
-            self.selection_point_inst.points = [x + r, y]
+            self._update_graphics_trigger()
 
-        self.dispatch('on_update')
+        self._dispatch_update()
         return True
 
-    def get_state(self, state=None):
-        d = super(PaintCircle, self).get_state(state)
-        for k in ['center', 'radius']:
-            d[k] = getattr(self, k)
-        return d
+    def _update_graphics(self, *largs):
+        if self.perim_ellipse_inst is None:
+            return
+
+        x, y = self.center
+        r = self.radius
+        circle = x, y, r
+        if circle == self._last_circle:
+            return
+
+        self._last_circle = circle
+        self.perim_ellipse_inst.circle = circle
+        sel_pts = self._sel_pts
+        sel_pts[0] = x + r
+        sel_pts[1] = y
+        self.selection_point_inst.points = sel_pts
 
     def rescale(self, scale):
         self.radius *= scale
@@ -1646,20 +1915,55 @@ class PaintEllipse(PaintShape):
     """(internal) The graphics instruction that rotates the ellipse.
     """
 
+    _cos_a = None
+
+    _sin_a = None
+
+    _handles = None
+
+    _suppress_update = False
+
+    _STATE_FIELDS = PaintShape._STATE_FIELDS + (
+        'center', 'radius_x', 'radius_y', 'angle')
+
     ready_to_finish = True
 
     is_valid = True
 
     def __init__(self, **kwargs):
         super(PaintEllipse, self).__init__(**kwargs)
+        self._update_angle_trig()
+        self.fbind('angle', self._update_angle_trig)
+        self.fbind('center', self._update_handles)
+        self.fbind('radius_x', self._update_handles)
+        self.fbind('radius_y', self._update_handles)
 
         def update(*largs):
-            self.translate()
+            if not self._suppress_update:
+                self.translate()
         self.fbind('radius_x', update)
         self.fbind('radius_y', update)
         self.fbind('angle', update)
         self.fbind('center', update)
 
+    def _update_angle_trig(self, *largs):
+        angle = self.angle
+        self._cos_a = cos(angle)
+        self._sin_a = sin(angle)
+        self._update_handles()
+
+    def _update_handles(self, *largs):
+        if self._suppress_update:
+            return
+
+        # the positions of the rotated points at the end of the x and y axes
+        x, y = self.center
+        cos_a, sin_a = self._cos_a, self._sin_a
+        rx, ry = abs(self.radius_x), abs(self.radius_y)
+        # the y axis is rotated by another pi / 2
+        self._handles = (
+            x + rx * cos_a, y + rx * sin_a, x - ry * sin_a, y + ry * cos_a)
+
     @classmethod
     def create_shape(
             cls, center=(0, 0), radius_x=dp(10), radius_y=dp(15), angle=0,
@@ -1697,7 +2001,7 @@ class PaintEllipse(PaintShape):
             angle = self.angle
 
             PushMatrix(group=name)
-            Rotate(angle=angle / pi * 180., origin=(x, y), group=name)
+            Rotate(angle=degrees(angle), origin=(x, y), group=name)
             Ellipse(size=(rx * 2., ry * 2.), pos=(x - rx, y - ry), group=name)
             PopMatrix(group=name)
 
@@ -1705,36 +2009,35 @@ class PaintEllipse(PaintShape):
         if not super(PaintEllipse, self).add_shape_to_canvas(paint_widget):
             return False
 
+        add = self.instruction_group.add
+        name = self.graphics_name
         colors = self.color_instructions = []
 
         x, y = self.center
         rx, ry = self.radius_x, self.radius_y
         angle = self.angle
 
-        i1 = self.ellipse_color_inst = Color(
-            *self.line_color, group=self.graphics_name)
+        i1 = self.ellipse_color_inst = Color(*self.line_color, group=name)
         colors.append(i1)
 
-        i2 = PushMatrix(group=self.graphics_name)
+        i2 = PushMatrix(group=name)
         i3 = self.rotate_inst = Rotate(
-            angle=angle / pi * 180., origin=(x, y), group=self.graphics_name)
+            angle=degrees(angle), origin=(x, y), group=name)
 
         i4 = self.perim_ellipse_inst = Line(
             ellipse=(x - rx, y - ry, 2 * rx, 2 * ry),
-            width=self.line_width, group=self.graphics_name)
+            width=self.line_width, group=name)
         i6 = self.selection_point_inst2 = Point(
-            points=[x, y + ry], pointsize=self.pointsize,
-            group=self.graphics_name)
-        i8 = Color(*self.selection_point_color, group=self.graphics_name)
+            points=[x, y + ry], pointsize=self.pointsize, group=name)
+        i8 = Color(*self.selection_point_color, group=name)
         colors.append(i8)
 
         i5 = self.selection_point_inst = Point(
-            points=[x + rx, y], pointsize=self.pointsize,
-            group=self.graphics_name)
-        i7 = PopMatrix(group=self.graphics_name)
+            points=[x + rx, y], pointsize=self.pointsize, group=name)
+        i7 = PopMatrix(group=name)
 
         for inst in (i1, i2, i3, i4, i6, i8, i5, i7):
-            self.instruction_group.add(inst)
+            add(inst)
         return True
 
     def remove_shape_from_canvas(self):
@@ -1776,26 +2079,35 @@ class PaintEllipse(PaintShape):
             px, py = px - cx, py - cy
             x, y = x - cx, y - cy
 
-            d1, d2 = self._get_interaction_points_dist(touch.pos)
-            if d1 <= d2:
-                angle = self.angle
+            y_axis = self._get_closest_axis(touch.pos)
+            if y_axis:
+                # rotated by another pi / 2
+                rrx, rry = -self._sin_a, self._cos_a
             else:
-                angle = self.angle + pi / 2.0
+                rrx, rry = self._cos_a, self._sin_a
 
-            rrx, rry = cos(angle), sin(angle)
             prev_r = px * rrx + py * rry
             r = x * rrx + y * rry
             if r <= dp2 or prev_r <= dp2:
                 return
 
-            prev_theta = atan2(py, px)
-            theta = atan2(y, x)
-            self.angle = (self.angle + theta - prev_theta) % (2 * pi)
+            # the signed angle from the previous to the current position
+            d_theta = atan2(px * y - py * x, px * x + py * y)
 
-            if d1 <= d2:
-                self.radius_x = max(self.radius_x + r - prev_r, dp2)
-            else:
-                self.radius_y = max(self.radius_y + r - prev_r, dp2)
+            # update the handles, graphics and dispatch on_update once, for
+            # both properties
+            self._suppress_update = True
+            try:
+                self.angle = (self.angle + d_theta) % (2 * pi)
+                if y_axis:
+                    self.radius_y = max(self.radius_y + r - prev_r, dp2)
+                else:
+                    self.radius_x = max(self.radius_x + r - prev_r, dp2)
+            finally:
+                self._suppress_update = False
+
+            self._update_handles()
+            self.translate()
 
     def handle_touch_up(self, touch, outside=False):
         if not self.finished:
@@ -1818,27 +2130,31 @@ class PaintEllipse(PaintShape):
         return False
 
     def get_selection_point_dist(self, pos):
-        x1, y1 = pos
-
-        x2, y2 = self.center
-        x2, y2 = _rotate_pos(x2 + self.radius_x, y2, x2, y2, self.angle)
-        return ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+        return self.get_selection_point_dist_sq(pos) ** 0.5
 
     def get_interaction_point_dist(self, pos):
-        d1, d2 = self._get_interaction_points_dist(pos)
-        return min(d1, d2)
+        return self.get_interaction_point_dist_sq(pos) ** 0.5
 
-    def _get_interaction_points_dist(self, pos):
+    def get_selection_point_dist_sq(self, pos):
         x1, y1 = pos
+        x2, y2, _, _ = self._handles
+        return (x1 - x2) ** 2 + (y1 - y2) ** 2
 
-        x2, y2 = self.center
-        x_, y_ = _rotate_pos(x2 + self.radius_x, y2, x2, y2, self.angle)
-        d1 = ((x1 - x_) ** 2 + (y1 - y_) ** 2) ** 0.5
+    def get_interaction_point_dist_sq(self, pos, max_dist_sq=None):
+        d1, d2 = self._get_interaction_points_dist_sq(pos)
+        return min(d1, d2)
 
-        x_, y_ = _rotate_pos(
-            x2, y2 + self.radius_y, x2, y2, self.angle, base_angle=pi / 2.0)
-        d2 = ((x1 - x_) ** 2 + (y1 - y_) ** 2) ** 0.5
-        return d1, d2
+    def _get_closest_axis(self, pos):
+        # 0 if the x-axis handle is the closest to pos, 1 for the y-axis
+        x, y = pos
+        x1, y1, x2, y2 = self._handles
+        return int((x - x1) ** 2 + (y - y1) ** 2 >
+                   (x - x2) ** 2 + (y - y2) ** 2)
+
+    def _get_interaction_points_dist_sq(self, pos):
+        x, y = pos
+        x1, y1, x2, y2 = self._handles
+        return (x - x1) ** 2 + (y - y1) ** 2, (x - x2) ** 2 + (y - y2) ** 2
 
     def lock(self):
         if super(PaintEllipse, self).lock():
@@ -1879,24 +2195,30 @@ class PaintEllipse(PaintShape):
         else:
             x, y = self.center
 
-        rx, ry = self.radius_x, self.radius_y
-        angle = self.angle
-        self.center = x, y
+        center = self.center
+        if center[0] != x or center[1] != y:
+            # the center binding calls translate() again, which updates the
+            # graphics and dispatches on_update
+            self.center = x, y
+            return True
+
         if self.rotate_inst is not None:
-            self.rotate_inst.angle = angle / pi * 180.
-            self.rotate_inst.origin = x, y
-            self.perim_ellipse_inst.ellipse = x - rx, y - ry, 2 * rx, 2 * ry
-            self.selection_point_inst.points = [x + rx, y]
-            self.selection_point_inst2.points = [x, y + ry]
+            self._update_graphics_trigger()
 
-        self.dispatch('on_update')
+        self._dispatch_update()
         return True
 
-    def get_state(self, state=None):
-        d = super(PaintEllipse, self).get_state(state)
-        for k in ['center', 'radius_x', 'radius_y', 'angle']:
-            d[k] = getattr(self, k)
-        return d
+    def _update_graphics(self, *largs):
+        if self.rotate_inst is None:
+            return
+
+        x, y = self.center
+        rx, ry = self.radius_x, self.radius_y
+        self.rotate_inst.angle = degrees(self.angle)
+        self.rotate_inst.origin = x, y
+        self.perim_ellipse_inst.ellipse = x - rx, y - ry, 2 * rx, 2 * ry
+        self.selection_point_inst.points = [x + rx, y]
+        self.selection_point_inst2.points = [x, y + ry]
 
     def rescale(self, scale):
         self.radius_x *= scale
@@ -1962,30 +2284,52 @@ class PaintPolygon(PaintShape):
     the perimeter.
     """
 
-    ready_to_finish = False
-
-    is_valid = False
-
     _last_point_moved = None
     """The index in :attr:`points` of the last perimeter point that was being
     dragged and changed by touch. This is how we have continuity when dragging
     a point.
     """
 
+    _suppress_update = False
+
+    _area_meshes = None
+
+    _close_buf = None
+
+    _bbox = None
+
+    _STATE_FIELDS = PaintShape._STATE_FIELDS + ('points', 'selection_point')
+
+    ready_to_finish = False
+
+    is_valid = False
+
     def __init__(self, **kwargs):
+        self._close_buf = [0, 0, 0, 0]
         super(PaintPolygon, self).__init__(**kwargs)
 
         def update(*largs):
+            self._bbox = None
+            if self._suppress_update:
+                return
             if self.perim_line_inst is not None:
-                self.perim_line_inst.points = self.points
-                self.perim_points_inst.points = self.points
-                self.selection_point_inst.points = self.selection_point
-            self.dispatch('on_update')
+                self._update_graphics_trigger()
+            self._dispatch_update()
 
         self.fbind('points', update)
         self.fbind('selection_point', update)
         update()
 
+    def _update_graphics(self, *largs):
+        if self.perim_line_inst is None:
+            return
+
+        self.perim_line_inst.points = self.points
+        self.perim_points_inst.points = self.points
+        self.selection_point_inst.points = self.selection_point
+        if self.perim_close_inst is not None and self.points:
+            self._update_close_line()
+
     @classmethod
     def create_shape(cls, points=(), selection_point=(), **inst_kwargs):
         """Creates a new polygon instance from the given arguments.
@@ -2021,51 +2365,66 @@ class PaintPolygon(PaintShape):
             if not points:
                 return
 
-            tess = Tesselator()
-            tess.add_contour(points)
-
-            if tess.tesselate():
-                for vertices, indices in tess.meshes:
-                    Mesh(
-                        vertices=vertices, indices=indices,
-                        mode='triangle_fan', group=name)
+            # re-use the meshes from the last tesselation if the polygon
+            # didn't change since
+            key = tuple(points)
+            if self._area_meshes is None or self._area_meshes[0] != key:
+                meshes = []
+                if _is_convex(points):
+                    # no need to tesselate, fan out from the first vertex
+                    vertices = []
+                    for x, y in zip(points[::2], points[1::2]):
+                        vertices.extend((x, y, x, y))
+                    meshes.append((vertices, list(range(len(points) // 2))))
+                else:
+                    tess = Tesselator()
+                    tess.add_contour(points)
+                    if tess.tesselate():
+                        meshes = [
+                            (list(vertices), list(indices))
+                            for vertices, indices in tess.meshes]
+                self._area_meshes = key, meshes
+
+            for vertices, indices in self._area_meshes[1]:
+                Mesh(
+                    vertices=vertices, indices=indices,
+                    mode='triangle_fan', group=name)
 
     def add_shape_to_canvas(self, paint_widget):
         if not super(PaintPolygon, self).add_shape_to_canvas(paint_widget):
             return False
 
+        add = self.instruction_group.add
+        name = self.graphics_name
         colors = self.color_instructions = []
 
-        i1 = self.perim_color_inst = Color(
-            *self.line_color, group=self.graphics_name)
+        i1 = self.perim_color_inst = Color(*self.line_color, group=name)
         colors.append(i1)
 
         i2 = self.perim_line_inst = Line(
             points=self.points, width=self.line_width,
-            close=self.finished, group=self.graphics_name)
+            close=self.finished, group=name)
         i3 = self.perim_points_inst = Point(
-            points=self.points, pointsize=self.pointsize,
-            group=self.graphics_name)
+            points=self.points, pointsize=self.pointsize, group=name)
 
         insts = [i1, i2, i3]
         if not self.finished:
             points = self.points[-2:] + self.points[:2]
             line = self.perim_close_inst = Line(
                 points=points, width=self.line_width,
-                close=False, group=self.graphics_name)
+                close=False, group=name)
             line.dash_offset = 4
             line.dash_length = 4
             insts.append(line)
 
-        i4 = Color(*self.selection_point_color, group=self.graphics_name)
+        i4 = Color(*self.selection_point_color, group=name)
         colors.append(i4)
 
         i5 = self.selection_point_inst = Point(
-            points=self.selection_point, pointsize=self.pointsize,
-            group=self.graphics_name)
+            points=self.selection_point, pointsize=self.pointsize, group=name)
 
         for inst in insts + [i4, i5]:
-            self.instruction_group.add(inst)
+            add(inst)
 
         return True
 
@@ -2112,12 +2471,23 @@ class PaintPolygon(PaintShape):
                 return
             self._last_point_moved = i
 
-        x, y = self.points[2 * i: 2 * i + 2]
-        x += touch.dx
-        y += touch.dy
-        self.points[2 * i: 2 * i + 2] = x, y
-        if not i:
+        points = self.points
+        self._move_vertex(
+            i, points[2 * i] + touch.dx, points[2 * i + 1] + touch.dy)
+
+    def _move_vertex(self, i, x, y):
+        if i:
+            self.points[2 * i: 2 * i + 2] = x, y
+            return
+
+        # the first point is also the selection point. Only update the
+        # graphics once, when the points are set
+        self._suppress_update = True
+        try:
             self.selection_point = [x, y]
+        finally:
+            self._suppress_update = False
+        self.points[:2] = x, y
 
     def handle_touch_up(self, touch, outside=False):
         if not self.finished:
@@ -2129,14 +2499,21 @@ class PaintPolygon(PaintShape):
                 if not self.selection_point:
                     self.selection_point = touch.pos[:]
                 self.points.extend(touch.pos)
-                if self.perim_close_inst is not None:
-                    self.perim_close_inst.points = \
-                        self.points[-2:] + self.points[:2]
-                if len(self.points) >= 6:
+                if not self.is_valid and len(self.points) >= 6:
                     self.is_valid = True
         else:
             self._last_point_moved = None
 
+    def _update_close_line(self):
+        # joins the last point to the first while the polygon is being drawn
+        points = self.points
+        buf = self._close_buf
+        buf[0] = points[-2]
+        buf[1] = points[-1]
+        buf[2] = points[0]
+        buf[3] = points[1]
+        self.perim_close_inst.points = buf
+
     def start_interaction(self, pos):
         if super(PaintPolygon, self).start_interaction(pos):
             if self.selection_point_inst is not None:
@@ -2154,35 +2531,55 @@ class PaintPolygon(PaintShape):
         return False
 
     def get_selection_point_dist(self, pos):
+        return self.get_selection_point_dist_sq(pos) ** 0.5
+
+    def get_interaction_point_dist(self, pos):
+        return self.get_interaction_point_dist_sq(pos) ** 0.5
+
+    def get_selection_point_dist_sq(self, pos):
         x1, y1 = pos
         if not self.selection_point:
-            return 10000.0
+            return 10000.0 ** 2
 
         x2, y2 = self.selection_point
-        return ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+        return (x1 - x2) ** 2 + (y1 - y2) ** 2
+
+    def get_interaction_point_dist_sq(self, pos, max_dist_sq=None):
+        if max_dist_sq is not None and self.points:
+            # skip the vertices if the bounding box is already too far
+            x, y = pos
+            x0, y0, x1, y1 = self._get_bbox()
+            dx = x0 - x if x < x0 else (x - x1 if x > x1 else 0)
+            dy = y0 - y if y < y0 else (y - y1 if y > y1 else 0)
+            dist = dx * dx + dy * dy
+            if dist >= max_dist_sq:
+                return dist
 
-    def get_interaction_point_dist(self, pos):
         i, dist = self._get_interaction_point(pos)
         if dist is None:
-            return 10000.0
+            return 10000.0 ** 2
         return dist
 
+    def _get_bbox(self):
+        bbox = self._bbox
+        if bbox is None:
+            points = self.points
+            xs = points[::2]
+            ys = points[1::2]
+            bbox = self._bbox = min(xs), min(ys), max(xs), max(ys)
+        return bbox
+
     def _get_interaction_point(self, pos):
         x1, y1 = pos
         points = self.points
         if not points:
             return None, None
 
-        min_i = 0
-        min_d = 10000.0
-        for i in range(len(points) // 2):
-            x, y = points[2 * i], points[2 * i + 1]
-            dist = ((x1 - x) ** 2 + (y1 - y) ** 2) ** 0.5
-            if dist < min_d:
-                min_d = dist
-                min_i = i
-
-        return min_i, min_d
+        # returns the squared distance
+        i, min_d = _nearest_vertex(points, x1, y1)
+        if min_d >= 10000.0 ** 2:
+            return 0, 10000.0 ** 2
+        return i, min_d
 
     def finish(self):
         if super(PaintPolygon, self).finish():
@@ -2233,36 +2630,51 @@ class PaintPolygon(PaintShape):
             assert False
 
         points = self.points
-        new_points = [None, ] * len(points)
-        for i in range(len(points) // 2):
-            new_points[2 * i] = points[2 * i] + dx
-            new_points[2 * i + 1] = points[2 * i + 1] + dy
-        self.selection_point = new_points[:2]
-        self.points = new_points
+        new_points = points[:]
+        new_points[::2] = [x + dx for x in points[::2]]
+        new_points[1::2] = [y + dy for y in points[1::2]]
+
+        # update the graphics and dispatch on_update once, for both properties
+        bbox = self._bbox
+        self._suppress_update = True
+        try:
+            self.selection_point = new_points[:2]
+            self.points = new_points
+        finally:
+            self._suppress_update = False
+
+        if bbox is not None:
+            x0, y0, x1, y1 = bbox
+            self._bbox = x0 + dx, y0 + dy, x1 + dx, y1 + dy
+        if self.perim_line_inst is not None:
+            self._update_graphics_trigger()
 
-        self.dispatch('on_update')
+        self._dispatch_update()
         return True
 
-    def get_state(self, state=None):
-        d = super(PaintPolygon, self).get_state(state)
-        for k in ['points', 'selection_point']:
-            d[k] = getattr(self, k)
-        return d
-
     def rescale(self, scale):
         points = self.points
         if not points:
             return
 
-        n = len(points) / 2.0
-        cx = sum(points[::2]) / n
-        cy = sum(points[1::2]) / n
-        x_vals = ((x_val - cx) * scale + cx for x_val in points[::2])
-        y_vals = ((y_val - cy) * scale + cy for y_val in points[1::2])
-
-        points = [val for point in zip(x_vals, y_vals) for val in point]
+        xs = points[::2]
+        ys = points[1::2]
+        n = float(len(xs))
+        # shift so that the centroid stays in place after scaling
+        ox = sum(xs) / n * (1 - scale)
+        oy = sum(ys) / n * (1 - scale)
+
+        points = points[:]
+        points[::2] = [x * scale + ox for x in xs]
+        points[1::2] = [y * scale + oy for y in ys]
+
+        # the graphics and on_update are refreshed once, when points is set
+        self._suppress_update = True
+        try:
+            self.selection_point = points[:2]
+        finally:
+            self._suppress_update = False
         self.points = points
-        self.selection_point = points[:2]
 
 
 class PaintFreeformPolygon(PaintPolygon):
@@ -2275,6 +2687,12 @@ class PaintFreeformPolygon(PaintPolygon):
     Otherwise, it's the same as :class:`PaintPolygon`.
     """
 
+    min_point_spacing = NumericProperty('2dp')
+    """The minimum distance between consecutive points added while drawing
+    the polygon. Touch positions closer than this to the last point are
+    dropped, which keeps the number of points down for dense touch input.
+    """
+
     def handle_touch_down(self, touch, opos=None):
         if not self.finished:
             pos = opos or touch.pos
@@ -2282,10 +2700,7 @@ class PaintFreeformPolygon(PaintPolygon):
                 self.selection_point = pos[:]
 
             self.points.extend(pos)
-            if self.perim_close_inst is not None:
-                self.perim_close_inst.points = \
-                    self.points[-2:] + self.points[:2]
-            if len(self.points) >= 6:
+            if not self.is_valid and len(self.points) >= 6:
                 self.is_valid = True
 
     def handle_touch_move(self, touch):
@@ -2295,10 +2710,15 @@ class PaintFreeformPolygon(PaintPolygon):
         if not self.selection_point:
             self.selection_point = touch.pos[:]
 
-        self.points.extend(touch.pos)
-        if self.perim_close_inst is not None:
-            self.perim_close_inst.points = self.points[-2:] + self.points[:2]
-        if len(self.points) >= 6:
+        points = self.points
+        if points:
+            dx = touch.x - points[-2]
+            dy = touch.y - points[-1]
+            if dx * dx + dy * dy < self.min_point_spacing ** 2:
+                return
+
+        points.extend(touch.pos)
+        if not self.is_valid and len(points) >= 6:
             self.is_valid = True
 
     def handle_touch_up(self, touch, outside=False):
@@ -2334,6 +2754,8 @@ class PaintPoint(PaintShape):
     """(internal) The graphics instruction representing the point.
     """
 
+    _STATE_FIELDS = PaintShape._STATE_FIELDS + ('position', )
+
     ready_to_finish = True
 
     is_valid = True
@@ -2377,26 +2799,26 @@ class PaintPoint(PaintShape):
         if not super().add_shape_to_canvas(paint_widget):
             return False
 
+        add = self.instruction_group.add
+        name = self.graphics_name
         colors = self.color_instructions = []
 
         x, y = self.position
-        inst = self.color_inst = Color(
-            *self.line_color, group=self.graphics_name)
+        inst = self.color_inst = Color(*self.line_color, group=name)
         colors.append(inst)
 
-        self.instruction_group.add(inst)
+        add(inst)
         inst = self.circle_inst = Line(
             circle=(x, y, self.pointsize + dp(2)), width=self.line_width,
-            group=self.graphics_name)
-        self.instruction_group.add(inst)
-        inst = Color(*self.selection_point_color, group=self.graphics_name)
-        self.instruction_group.add(inst)
+            group=name)
+        add(inst)
+        inst = Color(*self.selection_point_color, group=name)
+        add(inst)
         colors.append(inst)
 
         inst = self.point_inst = Point(
-            points=[x, y], pointsize=self.pointsize,
-            group=self.graphics_name)
-        self.instruction_group.add(inst)
+            points=[x, y], pointsize=self.pointsize, group=name)
+        add(inst)
         return True
 
     def remove_shape_from_canvas(self):
@@ -2448,12 +2870,18 @@ class PaintPoint(PaintShape):
         return False
 
     def get_selection_point_dist(self, pos):
+        return self.get_selection_point_dist_sq(pos) ** 0.5
+
+    def get_interaction_point_dist(self, pos):
+        return self.get_selection_point_dist_sq(pos) ** 0.5
+
+    def get_selection_point_dist_sq(self, pos):
         x1, y1 = pos
         x2, y2 = self.position
-        return ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+        return (x1 - x2) ** 2 + (y1 - y2) ** 2
 
-    def get_interaction_point_dist(self, pos):
-        return self.get_selection_point_dist(pos)
+    def get_interaction_point_dist_sq(self, pos, max_dist_sq=None):
+        return self.get_selection_point_dist_sq(pos)
 
     def lock(self):
         if super().lock():
@@ -2494,20 +2922,26 @@ class PaintPoint(PaintShape):
         else:
             x, y = self.position
 
-        self.position = x, y
+        position = self.position
+        if position[0] != x or position[1] != y:
+            # the position binding calls translate() again, which updates the
+            # graphics and dispatches on_update
+            self.position = x, y
+            return True
+
         if self.circle_inst is not None:
-            self.circle_inst.circle = x, y, self.pointsize + dp(2)
-        if self.point_inst is not None:
-            self.point_inst.points = [x, y]
+            self._update_graphics_trigger()
 
-        self.dispatch('on_update')
+        self._dispatch_update()
         return True
 
-    def get_state(self, state=None):
-        d = super().get_state(state)
-        for k in ['position', ]:
-            d[k] = getattr(self, k)
-        return d
+    def _update_graphics(self, *largs):
+        if self.circle_inst is None:
+            return
+
+        x, y = self.position
+        self.circle_inst.circle = x, y, self.pointsize + dp(2)
+        self.point_inst.points = [x, y]
 
     def rescale(self, scale):
         pass
@@ -2622,6 +3056,29 @@ class PaintCanvasBehavior(PaintCanvasBehaviorBase):
             self.add_shape(shape)
         return shape
 
+    def create_shapes_from_state(self, states, add=True):
+        """Recreates multiple shapes, similarly to
+        :meth:`create_shape_from_state`, e.g. when loading a saved painting.
+
+        All the shapes are created before any are added, so if any state is
+        invalid, none of the shapes are added.
+
+        :param states: A list of state dicts as returned by
+            :meth:`PaintShape.get_state`.
+        :param add: Whether to add them to the painter.
+        :return: The list of newly created shape instances.
+        """
+        cls_name_map = self.shape_cls_name_map
+        shapes = [
+            cls_name_map[state['cls']].create_shape_from_state(state)
+            for state in states]
+
+        if add:
+            add_shape = self.add_shape
+            for shape in shapes:
+                add_shape(shape)
+        return shapes
+
 
 if __name__ == '__main__':
     import random
@@ -2664,7 +3121,7 @@ if __name__ == '__main__':
             res = super(PainterWidget, self).keyboard_on_key_down(
                 window, keycode, text, modifiers)
             self.keys_down.add(keycode[1])
-            keys = sorted(self.keys_down, key=lambda x: len(x), reverse=True)
+            keys = sorted(self.keys_down, key=len, reverse=True)
             self.keyboard_keys = ' | '.join(keys)
             return res
 
@@ -2672,7 +3129,7 @@ if __name__ == '__main__':
             res = super(PainterWidget, self).keyboard_on_key_up(
                 window, keycode)
             self.keys_down.remove(keycode[1])
-            keys = sorted(self.keys_down, key=lambda x: len(x), reverse=True)
+            keys = sorted(self.keys_down, key=len, reverse=True)
             self.keyboard_keys = ' | '.join(keys)
             return res
 
@@ -0,0 +1,542 @@
+import pytest
+
+
+@pytest.fixture
+def painter():
+    from kivy_garden.painter import PaintCanvasBehavior
+    from kivy.uix.widget import Widget
+
+    class Painter(PaintCanvasBehavior, Widget):
+        pass
+
+    return Painter()
+
+
+@pytest.fixture
+def window_painter(painter):
+    from kivy.base import EventLoop
+    EventLoop.ensure_window()
+    window = EventLoop.window
+    painter.size = window.size
+    window.add_widget(painter)
+    yield painter
+    window.remove_widget(painter)
+
+
+def canvas_shapes(painter):
+    groups = {id(s.instruction_group): s for s in painter.shapes}
+    return [groups[id(c)] for c in painter.canvas.children
+            if id(c) in groups]
+
+
+def test_reorder_shape(painter):
+    shapes = [
+        painter.create_add_shape('circle', center=(i * 30, 40), radius=10)
+        for i in range(5)]
+
+    painter.reorder_shape(shapes[0])
+    assert painter.shapes == shapes[1:] + shapes[:1]
+    assert canvas_shapes(painter) == painter.shapes
+
+    painter.reorder_shape(shapes[4], shapes[2])
+    assert painter.shapes == [
+        shapes[1], shapes[4], shapes[2], shapes[3], shapes[0]]
+    assert canvas_shapes(painter) == painter.shapes
+
+    painter.reorder_shape(shapes[1], shapes[0])
+    assert painter.shapes == [
+        shapes[4], shapes[2], shapes[3], shapes[1], shapes[0]]
+    assert canvas_shapes(painter) == painter.shapes
+
+    # already in place
+    painter.reorder_shape(shapes[3], shapes[1])
+    painter.reorder_shape(shapes[0])
+    assert painter.shapes == [
+        shapes[4], shapes[2], shapes[3], shapes[1], shapes[0]]
+    assert canvas_shapes(painter) == painter.shapes
+
+
+@pytest.mark.parametrize(
+    'cls_name', ['PaintCircle', 'PaintEllipse', 'PaintPolygon',
+                 'PaintFreeformPolygon', 'PaintPoint'])
+def test_shape_defaults(painter, cls_name):
+    import kivy_garden.painter as painter_mod
+    cls = getattr(painter_mod, cls_name)
+
+    shape = cls()
+    assert not shape.finished
+    assert not shape.selected
+    assert shape.paint_widget is None
+    assert shape.instruction_group is None
+    assert shape.ready_to_finish == shape.is_valid
+
+    # user attributes and class level defaults still work
+    shape.tag = 1
+    assert shape.tag == 1
+
+    class Shape(cls):
+        ready_to_finish = True
+        is_valid = True
+
+    shape = Shape()
+    assert shape.ready_to_finish
+    assert shape.is_valid
+
+
+def test_shape_dist_sq(painter):
+    shapes = [
+        painter.create_add_shape('circle', center=(100, 100), radius=20),
+        painter.create_add_shape(
+            'ellipse', center=(300, 300), radius_x=30, radius_y=15,
+            angle=.5),
+        painter.create_add_shape(
+            'polygon', points=[500, 500, 600, 500, 600, 650]),
+        painter.create_add_shape('point', position=(800, 800)),
+    ]
+
+    for shape in shapes:
+        for pos in [(0, 0), (120, 100), (310, 320), (600, 510), (800, 799)]:
+            assert shape.get_selection_point_dist_sq(pos) == pytest.approx(
+                shape.get_selection_point_dist(pos) ** 2)
+            assert shape.get_interaction_point_dist_sq(pos) == \
+                pytest.approx(shape.get_interaction_point_dist(pos) ** 2)
+
+    assert painter.get_closest_selection_point_shape(121, 100) is shapes[0]
+    assert painter.get_closest_shape(599, 651) is shapes[2]
+    assert painter.get_closest_shape(700, 700) is None
+
+
+def test_polygon_area_graphics(painter):
+    from kivy.graphics import Canvas, Mesh
+
+    shape = painter.create_add_shape(
+        'polygon', points=[0, 0, 300, 0, 300, 800, 0, 800])
+
+    def meshes():
+        canvas = Canvas()
+        shape.add_area_graphics_to_canvas('area', canvas)
+        return [(list(c.vertices), list(c.indices))
+                for c in canvas.children if isinstance(c, Mesh)]
+
+    first = meshes()
+    assert first
+    assert meshes() == first
+
+    shape.translate(dpos=(10, 10))
+    moved = meshes()
+    assert moved != first
+    assert moved[0][0][:2] == [first[0][0][0] + 10, first[0][0][1] + 10]
+
+
+def test_polygon_convex_area(painter):
+    from kivy_garden.painter import _is_convex
+    from kivy.graphics import Canvas, Mesh
+
+    square = [0, 0, 300, 0, 300, 800, 0, 800]
+    concave = [0, 0, 10, 0, 10, 10, 5, 2, 0, 10]
+    star = [0, 10, 6, -8, -9, 3, 9, 3, -6, -8]
+    assert _is_convex(square)
+    assert _is_convex(square[::-1])
+    assert not _is_convex(concave)
+    assert not _is_convex(star)
+    assert not _is_convex([0, 0, 1, 1, 2, 2])
+    # the concave shape with its reflex vertex repeated at the end
+    assert not _is_convex([0, 10, 0, 0, 10, 0, 10, 10, 5, 2, 5, 2])
+    # an edge that doubles back on the previous one
+    assert not _is_convex([0, 1, 3, 2, 3, 3, 3, 0, 4, 3])
+    assert _is_convex([0, 0, 0, 0, 5, 0, 10, 0, 10, 10, 0, 10, 0, 0])
+
+    def fan(points):
+        vertices = []
+        for x, y in zip(points[::2], points[1::2]):
+            vertices.extend([x, y, x, y])
+        return [(vertices, list(range(len(points) // 2)))]
+
+    for points, convex in [(square, True), (concave, False)]:
+        shape = painter.create_add_shape('polygon', points=points)
+        canvas = Canvas()
+        shape.add_area_graphics_to_canvas('area', canvas)
+        meshes = [(list(c.vertices), list(c.indices))
+                  for c in canvas.children if isinstance(c, Mesh)]
+        assert meshes
+        # only convex polygons are filled with a fan over their vertices
+        assert (meshes == fan(points)) == convex
+
+
+def test_freeform_min_point_spacing(window_painter):
+    from kivy.metrics import dp
+    from kivy.tests.common import UnitTestTouch
+    from kivy_garden.painter import PaintFreeformPolygon
+    assert PaintFreeformPolygon().min_point_spacing == dp(2)
+
+    painter = window_painter
+    painter.draw_mode = 'freeform'
+    touch = UnitTestTouch(10, 10)
+    touch.touch_down()
+    # the shape is only created on the first move
+    touch.touch_move(20, 10)
+    shape = painter.current_shape
+    shape.min_point_spacing = 5
+    assert shape.points == pytest.approx([10, 10, 20, 10])
+    assert not shape.is_valid
+
+    # samples closer than the spacing to the last kept point are dropped
+    for x, y, valid in [(22, 11, False), (23, 13, False), (20, 20, True),
+                        (23, 23, True), (30, 25, True)]:
+        touch.touch_move(x, y)
+        assert shape.is_valid == valid
+
+    assert shape.points == pytest.approx([10, 10, 20, 10, 20, 20, 30, 25])
+    touch.touch_up()
+    assert shape.finished
+    assert painter.shapes == [shape]
+
+
+def test_create_shapes_from_state(painter):
+    shapes = [
+        painter.create_add_shape('circle', center=(100, 100), radius=20),
+        painter.create_add_shape(
+            'polygon', points=[500, 500, 600, 500, 600, 650]),
+        painter.create_add_shape('point', position=(800, 800)),
+    ]
+    states = [shape.get_state() for shape in shapes]
+
+    new_shapes = painter.create_shapes_from_state(states)
+    assert painter.shapes == shapes + new_shapes
+    assert [s.get_state() for s in new_shapes] == states
+
+    with pytest.raises(ValueError):
+        painter.create_shapes_from_state(
+            states + [dict(states[1], points=[0, 0])])
+    assert painter.shapes == shapes + new_shapes
+
+
+def test_polygon_max_dist_sq(painter):
+    shape = painter.create_add_shape(
+        'polygon', points=[500, 500, 600, 500, 600, 650])
+
+    assert shape.get_interaction_point_dist_sq(
+        (0, 500), max_dist_sq=100) >= 100
+    assert shape.get_interaction_point_dist_sq(
+        (598, 500), max_dist_sq=100) == 4
+
+    shape.translate(dpos=(-500, 0))
+    assert shape.get_interaction_point_dist_sq(
+        (0, 500), max_dist_sq=100) == 0
+
+
+def test_shapes_membership_sets(painter):
+    shapes = [
+        painter.create_add_shape('circle', center=(i * 30, 40), radius=10)
+        for i in range(3)]
+    assert painter._shapes_set == set(shapes)
+
+    painter.select_shape(shapes[1])
+    assert painter._selected_shapes_set == {shapes[1]}
+
+    assert painter.remove_shape(shapes[1])
+    assert not painter.remove_shape(shapes[1])
+    assert painter._shapes_set == {shapes[0], shapes[2]}
+    assert not painter._selected_shapes_set
+
+    painter.shapes = shapes[:1]
+    assert painter._shapes_set == {shapes[0]}
+
+
+def test_shapes_sets_observer(painter):
+    shapes = [
+        painter.create_add_shape('circle', center=(i * 30, 40), radius=10)
+        for i in range(3)]
+
+    def remove_first(*largs):
+        if len(painter.shapes) > 3:
+            del painter.shapes[0]
+    painter.fbind('shapes', remove_first)
+
+    shape = painter.create_add_shape('circle', center=(100, 40), radius=10)
+    assert painter.shapes == shapes[1:] + [shape]
+    assert painter._shapes_set == set(painter.shapes)
+    assert not painter.remove_shape(shapes[0])
+
+
+@pytest.mark.parametrize('name,kwargs', [
+    ('circle', {'center': (50, 50), 'radius': 10}),
+    ('ellipse', {'center': (50, 50)}),
+    ('point', {'position': (50, 50)}),
+])
+def test_translate_single_update(painter, name, kwargs):
+    shape = painter.create_add_shape(name, **kwargs)
+    updates = []
+    shape.fbind('on_update', lambda *largs: updates.append(1))
+
+    assert shape.translate(dpos=(3, 4))
+    assert len(updates) == 1
+    assert shape.translate(pos=(10, 20))
+    assert len(updates) == 2
+    assert shape.get_state()[list(kwargs)[0]] == [10, 20]
+
+
+@pytest.mark.parametrize('name,kwargs', [
+    ('circle', {'center': (50, 50), 'radius': 10}),
+    ('ellipse', {'center': (50, 50)}),
+    ('polygon', {'points': [500, 500, 600, 500, 600, 650]}),
+    ('point', {'position': (50, 50)}),
+])
+def test_translate_zero(painter, name, kwargs):
+    shape = painter.create_add_shape(name, **kwargs)
+    state = shape.get_state()
+
+    assert shape.translate(dpos=(0, 0))
+    assert shape.get_state() == state
+
+
+def test_deferred_graphics_update(painter):
+    from kivy.clock import Clock
+    from kivy_garden.painter import PaintCircle
+    assert PaintCircle.create_shape()._update_graphics_trigger is None
+
+    circle = painter.create_add_shape('circle', center=(50, 50), radius=10)
+    polygon = painter.create_add_shape(
+        'polygon', points=[500, 500, 600, 500, 600, 650])
+    assert circle._update_graphics_trigger is not None
+
+    circle.translate(dpos=(5, 5))
+    polygon.translate(dpos=(-100, 10))
+    Clock.tick()
+
+    assert list(circle.selection_point_inst.points) == [65, 55]
+    assert list(polygon.perim_line_inst.points) == [
+        400, 510, 500, 510, 500, 660]
+    assert list(polygon.selection_point_inst.points) == [400, 510]
+
+
+def test_clone_shape(painter):
+    import copy
+    shape = painter.create_add_shape(
+        'polygon', points=[500, 500, 600, 500, 600, 650])
+
+    for new_shape in (shape.clone(), copy.deepcopy(shape)):
+        assert new_shape is not shape
+        assert new_shape.finished
+        assert new_shape.get_state() == shape.get_state()
+        assert new_shape not in painter.shapes
+
+    new_shape = painter.duplicate_shape(shape)
+    assert painter.shapes == [shape, new_shape]
+    assert new_shape.points == [515, 515, 615, 515, 615, 665]
+
+
+def test_show_hide_shape(painter):
+    shape = painter.create_add_shape('circle', center=(100, 100), radius=20)
+    colors = [list(c.rgba) for c in shape.color_instructions]
+    assert colors
+
+    shape.hide_shape_in_canvas()
+    assert [list(c.rgba) for c in shape.color_instructions] == [
+        rgba[:3] + [0] for rgba in colors]
+
+    shape.show_shape_in_canvas()
+    shape.show_shape_in_canvas()
+    assert [list(c.rgba) for c in shape.color_instructions] == colors
+
+
+def test_set_state_single_update(painter):
+    shape = painter.create_add_shape(
+        'ellipse', center=(300, 300), radius_x=30, radius_y=15)
+    updates = []
+    shape.fbind('on_update', lambda *largs: updates.append(1))
+
+    state = shape.get_state()
+    state.update(center=[10, 20], radius_x=40, angle=1, locked=True)
+    shape.set_state(state)
+    assert len(updates) == 1
+    assert shape.locked
+    assert shape.get_state() == state
+
+    shape.translate(dpos=(1, 1))
+    assert len(updates) == 2
+
+
+def test_min_touch_dist(painter):
+    from kivy.metrics import dp
+    shape = painter.create_add_shape('point', position=(100, 100))
+
+    assert painter.get_closest_shape(100 + dp(9), 100) is shape
+    assert painter.get_closest_shape(100 + dp(11), 100) is None
+
+    painter.min_touch_dist = 20
+    assert painter.get_closest_shape(100 + dp(11), 100) is shape
+
+
+def test_min_touch_dist_density(painter):
+    from kivy.metrics import Metrics
+    painter.min_touch_dist = 10
+    density = Metrics.density
+
+    try:
+        Metrics.density = 1
+        assert painter._get_min_touch_dist_sq() == pytest.approx(100)
+        Metrics.density = 2
+        assert painter._get_min_touch_dist_sq() == pytest.approx(400)
+
+        shape = painter.create_add_shape('point', position=(100, 100))
+        assert painter.get_closest_shape(115, 100) is shape
+        Metrics.density = 1
+        assert painter.get_closest_shape(115, 100) is None
+    finally:
+        Metrics.density = density
+
+
+def test_shape_cls_name_map():
+    from kivy_garden.painter import PaintCanvasBehavior, PaintCircle
+    from kivy.uix.widget import Widget
+
+    class Painter(PaintCanvasBehavior, Widget):
+        pass
+
+    class Circle(PaintCircle):
+        pass
+
+    PaintCanvasBehavior.shape_cls_map['my_circle'] = Circle
+    try:
+        painter = Painter()
+        shape = painter.create_add_shape(
+            'my_circle', center=(100, 100), radius=20)
+        new_shape = painter.create_shape_from_state(shape.get_state())
+    finally:
+        del PaintCanvasBehavior.shape_cls_map['my_circle']
+
+    assert type(new_shape) is Circle
+    assert 'Circle' not in Painter().shape_cls_name_map
+
+
+def touch_path(points):
+    from kivy.tests.common import UnitTestTouch
+    touch = UnitTestTouch(*points[0])
+    touch.touch_down()
+    for x, y in points[1:]:
+        touch.touch_move(x, y)
+    touch.touch_up()
+
+
+def press_key(painter, key):
+    painter.keyboard_on_key_down(None, (0, key), '', [])
+    painter.keyboard_on_key_up(None, (0, key))
+
+
+def test_touch_draw_select_drag(window_painter):
+    painter = window_painter
+    painter.draw_mode = 'circle'
+
+    # a drag or a tap on empty space draws a new shape
+    touch_path([(100, 100), (120, 100)])
+    touch_path([(300, 300)])
+    c1, c2 = painter.shapes
+    assert c1.center == pytest.approx([100, 100])
+    assert c2.center == pytest.approx([300, 300])
+    assert c1.finished and c2.finished
+    assert painter.current_shape is None
+
+    # tapping the selection point selects the shape
+    touch_path([(110, 100)])
+    assert painter.selected_shapes == [c1]
+
+    # tapping another one replaces the selection
+    touch_path([(310, 300)])
+    assert painter.selected_shapes == [c2]
+
+    # dragging a selected shape moves it and keeps it selected
+    touch_path([(310, 300), (320, 305)])
+    assert c2.center == pytest.approx([310, 305])
+    assert painter.selected_shapes == [c2]
+
+    # dragging an unselected shape moves it without selecting it
+    touch_path([(110, 100), (130, 100)])
+    assert c1.center == pytest.approx([120, 100])
+    assert not painter.selected_shapes
+
+    # tapping empty space with a selection only clears the selection
+    touch_path([(320, 305)])
+    assert painter.selected_shapes == [c2]
+    touch_path([(600, 500)])
+    assert not painter.selected_shapes
+    assert painter.shapes == [c1, c2]
+
+
+def test_touch_multiselect_keys(window_painter):
+    painter = window_painter
+    c1 = painter.create_add_shape('circle', center=(100, 100), radius=10)
+    c2 = painter.create_add_shape('circle', center=(300, 300), radius=10)
+
+    touch_path([(110, 100)])
+    press_key(painter, 'right')
+    press_key(painter, 'up')
+    assert c1.center == pytest.approx([101, 101])
+    assert c2.center == pytest.approx([300, 300])
+
+    # with ctrl held, taps add to the selection and drags move all of it
+    painter.keyboard_on_key_down(None, (0, 'lctrl'), '', [])
+    touch_path([(310, 300)])
+    assert painter.selected_shapes == [c1, c2]
+    touch_path([(310, 300), (320, 305)])
+    assert c1.center == pytest.approx([111, 106])
+    assert c2.center == pytest.approx([310, 305])
+    assert painter.selected_shapes == [c1, c2]
+
+    # a ctrl tap on a selected shape de-selects it
+    touch_path([(121, 106)])
+    assert painter.selected_shapes == [c2]
+    painter.keyboard_on_key_up(None, (0, 'lctrl'))
+
+    press_key(painter, 'escape')
+    assert not painter.selected_shapes
+
+    painter.keyboard_on_key_down(None, (0, 'lctrl'), '', [])
+    press_key(painter, 'a')
+    painter.keyboard_on_key_up(None, (0, 'lctrl'))
+    assert painter.selected_shapes == [c1, c2]
+
+    press_key(painter, 'delete')
+    assert not painter.shapes
+    assert not painter.selected_shapes
+
+
+def test_long_touch_edit(window_painter):
+    from kivy.clock import Clock
+    from kivy.tests.common import UnitTestTouch
+    painter = window_painter
+    painter.long_touch_delay = 0
+    circle = painter.create_add_shape('circle', center=(300, 300), radius=10)
+
+    # holding the touch makes the shape current, and moving edits it
+    touch = UnitTestTouch(310, 300)
+    touch.touch_down()
+    Clock.tick()
+    assert painter.current_shape is circle
+    touch.touch_move(320, 300)
+    touch.touch_up()
+    assert circle.radius == pytest.approx(20)
+    assert circle.center == pytest.approx([300, 300])
+
+    press_key(painter, 'escape')
+    assert painter.current_shape is None
+
+
+def test_touch_draw_polygon(window_painter):
+    from kivy.tests.common import UnitTestTouch
+    painter = window_painter
+    painter.draw_mode = 'polygon'
+
+    for pos in [(500, 100), (600, 100), (600, 200)]:
+        touch_path([pos])
+    shape = painter.current_shape
+    assert not shape.finished
+    assert shape.points == pytest.approx([500, 100, 600, 100, 600, 200])
+
+    touch = UnitTestTouch(600, 200)
+    touch.is_double_tap = True
+    touch.touch_down()
+    touch.touch_up()
+    assert shape.finished
+    assert painter.current_shape is None
+    assert painter.shapes == [shape]